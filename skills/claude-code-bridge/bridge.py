@@ -4,7 +4,8 @@ bridge.py - Two-way bridge between OpenClaw and Claude Code.
 
 Uses the Claude Agent SDK to run Claude Code with a can_use_tool callback
 that intercepts AskUserQuestion, enabling OpenClaw to relay questions to
-users and return answers via file-based IPC.
+users and return answers over a Unix socket in the task directory
+(answer.sock), or via answer.json with CLAUDE_BRIDGE_IPC=file.
 
 Usage:
     python3 bridge.py --task-id <id> --workdir <dir> --prompt <text>
@@ -12,11 +13,12 @@ Usage:
 
 import asyncio
 import argparse
+import atexit
 import json
 import os
 import signal
 import sys
-import time
+import tempfile
 from datetime import datetime
 from pathlib import Path
 
@@ -33,28 +35,74 @@ from claude_agent_sdk import (
     query,
 )
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Answer-wait backend: inotify on Linux, watchfiles (FSEvents/kqueue) elsewhere,
+# polling if neither is installed.
+try:
+    import aionotify
+except (ImportError, OSError):  # OSError: aionotify loads libc.so.6 at import (glibc only)
+    aionotify = None
+
+try:
+    from watchfiles import awatch
+except ImportError:
+    awatch = None
+
 BRIDGE_HOME = Path.home() / ".claude-bridge"
 TASKS_DIR = BRIDGE_HOME / "tasks"
-POLL_INTERVAL = 2.0
+POLL_BACKOFF_MAX = 0.25  # cap for the polling fallback's backoff
 ANSWER_TIMEOUT = 600  # 10 minutes
 
+# Read the umask once (it can only be read by setting it) so task files
+# written via mkstemp (0600) get the usual 0666 & ~umask permissions
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+# "socket" (default) receives answers on answer.sock; "file" waits for answer.json
+ANSWER_IPC = os.environ.get("CLAUDE_BRIDGE_IPC", "socket")
+
 
 # ── File I/O helpers ─────────────────────────────────────
 
+def dump_json(data: dict) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str)
+    return json.dumps(data, indent=2, default=str).encode()
+
+
 def write_json_atomic(filepath: Path, data: dict):
-    """Write JSON atomically via tmp+rename."""
-    tmp = filepath.with_suffix(".tmp")
-    tmp.write_text(json.dumps(data, indent=2, default=str))
-    tmp.rename(filepath)
+    """Write JSON atomically via a unique tmp file + rename."""
+    fd, tmp = tempfile.mkstemp(dir=filepath.parent, prefix=filepath.name + ".", suffix=".tmp")
+    try:
+        os.fchmod(fd, 0o666 & ~_UMASK)
+        with os.fdopen(fd, "wb") as f:
+            f.write(dump_json(data))
+        os.replace(tmp, filepath)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+def load_json(data: bytes):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
 
 
 def read_json(filepath: Path) -> dict | None:
     if filepath.exists():
-        return json.loads(filepath.read_text())
+        return load_json(filepath.read_bytes())
     return None
 
 
 def write_status(task_dir: Path, status: str, detail: str = ""):
+    """Write status.json, skipping writes that would not change status or detail."""
+    global _last_status_key
+    if (status, detail) == _last_status_key:
+        return
+    _last_status_key = (status, detail)
+
     write_json_atomic(task_dir / "status.json", {
         "status": status,
         "detail": detail,
@@ -63,9 +111,92 @@ def write_status(task_dir: Path, status: str, detail: str = ""):
     })
 
 
-def append_log(task_dir: Path, text: str):
-    with open(task_dir / "output.log", "a") as f:
-        f.write(text)
+def append_log(text: str):
+    """Append to output.log via the fd opened once in run_bridge."""
+    os.write(_log_fd, text.encode())
+
+
+# ── Answer delivery ─────────────────────────────────────
+
+def _deliver_answer(line: bytes) -> bytes:
+    """Resolve the pending question with one answer line; return the reply for the client."""
+    try:
+        answer_data = load_json(line)
+        if not isinstance(answer_data, dict):
+            raise ValueError("answer must be a JSON object")
+    except ValueError:
+        return b"error: invalid JSON\n"
+    if _pending_answer is None or _pending_answer.done():
+        return b"error: no pending question\n"
+    _pending_answer.set_result(answer_data)
+    return b"ok\n"
+
+
+async def on_answer_connection(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+    """Receive one JSON answer line on answer.sock and hand it to the pending question."""
+    try:
+        try:
+            line = await reader.readline()
+        except ValueError:
+            # readline() raises ValueError once a line exceeds the stream limit
+            reply = b"error: answer too long\n"
+        else:
+            reply = _deliver_answer(line)
+        writer.write(reply)
+        await writer.drain()
+    finally:
+        writer.close()
+
+
+async def wait_for_answer(answer_path: Path, timeout: float) -> dict | None:
+    """Wait for OpenClaw's answer. Returns None if the timeout elapses first."""
+    if _pending_answer is not None:
+        try:
+            return await asyncio.wait_for(_pending_answer, timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    try:
+        await asyncio.wait_for(_await_answer_file(answer_path), timeout)
+    except asyncio.TimeoutError:
+        if not answer_path.exists():
+            return None
+    return read_json(answer_path) or {}
+
+
+async def _await_answer_file(answer_path: Path):
+    # The answer may have landed before we started waiting
+    if answer_path.exists():
+        return
+
+    if _answer_watcher is not None:
+        # The watch is armed in run_bridge, so a rename that lands after the
+        # exists() check above is already queued as an event.
+        while True:
+            event = await _answer_watcher.get_event()
+            if event.name == answer_path.name and answer_path.exists():
+                return
+
+    if awatch is not None:
+        # watchfiles arms its watch inside awatch(), after the exists() check,
+        # so it also yields on an idle timeout to re-check for a missed rename.
+        # FSEvents may report the rename as modified or as a pair, so any
+        # batch triggers the check rather than filtering on Change.added.
+        async for _ in awatch(
+            str(answer_path.parent),
+            debounce=50,
+            step=20,
+            rust_timeout=5000,
+            yield_on_timeout=True,
+        ):
+            if answer_path.exists():
+                return
+
+    # Polling fallback: yield once, then back off exponentially up to the cap
+    backoff = 0.0
+    while not answer_path.exists():
+        await asyncio.sleep(backoff)
+        backoff = min(backoff * 2 or 0.01, POLL_BACKOFF_MAX)
 
 
 # ── can_use_tool callback ───────────────────────────────
@@ -80,11 +211,15 @@ async def can_use_tool(
 
 
 async def handle_ask_user_question(input_data: dict):
-    """Write question to disk, poll for answer file, return answer to Claude."""
-    global _task_dir
+    """Write question to disk, wait for the answer, return it to Claude."""
+    global _task_dir, _pending_answer
 
     questions = input_data.get("questions", [])
 
+    # Arm the socket handler before the question is visible to OpenClaw
+    if _answer_server is not None:
+        _pending_answer = asyncio.get_running_loop().create_future()
+
     # Write question for OpenClaw to read
     write_json_atomic(_task_dir / "question.json", {
         "questions": questions,
@@ -97,51 +232,47 @@ async def handle_ask_user_question(input_data: dict):
     if answer_path.exists():
         answer_path.unlink()
 
-    # Poll for answer
-    start_time = time.time()
-    while True:
-        if answer_path.exists():
-            answer_data = read_json(answer_path)
-
-            # Clean up IPC files
-            (_task_dir / "question.json").unlink(missing_ok=True)
-            answer_path.unlink(missing_ok=True)
-            write_status(_task_dir, "running", "Received answer, continuing")
-
-            # Map answer to SDK format
-            answers = {}
-            if answer_data and "answers" in answer_data:
-                answers = answer_data["answers"]
-            elif answer_data and "text" in answer_data:
-                # Simple text answer — map to first question
-                if questions:
-                    answers = {questions[0]["question"]: answer_data["text"]}
-
-            return PermissionResultAllow(updated_input={
-                "questions": questions,
-                "answers": answers,
-            })
-
-        # Check timeout
-        if time.time() - start_time > ANSWER_TIMEOUT:
-            (_task_dir / "question.json").unlink(missing_ok=True)
-            write_status(_task_dir, "running", "Answer timed out, continuing with default")
-
-            # Default: pick first option for each question
-            default_answers = {}
-            for q in questions:
-                options = q.get("options", [])
-                if options:
-                    default_answers[q["question"]] = options[0]["label"]
-                else:
-                    default_answers[q["question"]] = "No preference"
-
-            return PermissionResultAllow(updated_input={
-                "questions": questions,
-                "answers": default_answers,
-            })
-
-        await asyncio.sleep(POLL_INTERVAL)
+    try:
+        answer_data = await wait_for_answer(answer_path, ANSWER_TIMEOUT)
+    finally:
+        _pending_answer = None
+
+    if answer_data is not None:
+        # Clean up IPC files
+        (_task_dir / "question.json").unlink(missing_ok=True)
+        answer_path.unlink(missing_ok=True)
+        write_status(_task_dir, "running", "Received answer, continuing")
+
+        # Map answer to SDK format
+        answers = {}
+        if "answers" in answer_data:
+            answers = answer_data["answers"]
+        elif "text" in answer_data:
+            # Simple text answer — map to first question
+            if questions:
+                answers = {questions[0]["question"]: answer_data["text"]}
+
+        return PermissionResultAllow(updated_input={
+            "questions": questions,
+            "answers": answers,
+        })
+
+    (_task_dir / "question.json").unlink(missing_ok=True)
+    write_status(_task_dir, "running", "Answer timed out, continuing with default")
+
+    # Default: pick first option for each question
+    default_answers = {}
+    for q in questions:
+        options = q.get("options", [])
+        if options:
+            default_answers[q["question"]] = options[0]["label"]
+        else:
+            default_answers[q["question"]] = "No preference"
+
+    return PermissionResultAllow(updated_input={
+        "questions": questions,
+        "answers": default_answers,
+    })
 
 
 # ── Dummy PreToolUse hook (required Python SDK workaround) ──
@@ -167,10 +298,34 @@ async def prompt_stream(prompt_text: str):
 # ── Main execution ──────────────────────────────────────
 
 async def run_bridge(task_id: str, workdir: str, prompt: str):
-    global _task_dir
+    global _task_dir, _answer_watcher, _answer_server, _log_fd
     _task_dir = TASKS_DIR / task_id
     _task_dir.mkdir(parents=True, exist_ok=True)
 
+    # Listen for answers on answer.sock; fall back to answer.json if unavailable
+    socket_path = _task_dir / "answer.sock"
+    if ANSWER_IPC == "socket":
+        socket_path.unlink(missing_ok=True)
+        try:
+            _answer_server = await asyncio.start_unix_server(on_answer_connection, path=str(socket_path))
+        except (AttributeError, NotImplementedError, OSError) as e:
+            # No AF_UNIX (Windows) or the path is too long for sun_path
+            print(f"answer.sock unavailable ({e}), using answer.json", file=sys.stderr)
+
+    # Otherwise watch the task dir for answer.json (written via tmp + mv)
+    if _answer_server is None and aionotify is not None:
+        _answer_watcher = aionotify.Watcher()
+        _answer_watcher.watch(
+            path=str(_task_dir),
+            flags=aionotify.Flags.CREATE | aionotify.Flags.MOVED_TO,
+        )
+        try:
+            await _answer_watcher.setup(asyncio.get_running_loop())
+        except OSError as e:
+            # e.g. inotify watch limit exhausted; use watchfiles or polling instead
+            print(f"inotify unavailable ({e}), falling back", file=sys.stderr)
+            _answer_watcher = None
+
     # Write PID
     (_task_dir / "bridge.pid").write_text(str(os.getpid()))
 
@@ -183,8 +338,9 @@ async def run_bridge(task_id: str, workdir: str, prompt: str):
     })
     write_status(_task_dir, "starting", "Initializing Claude Code session")
 
-    # Ensure output.log exists
-    (_task_dir / "output.log").touch()
+    # Open output.log once; O_APPEND keeps each write at the end
+    _log_fd = os.open(_task_dir / "output.log", os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    atexit.register(os.close, _log_fd)
 
     options = ClaudeAgentOptions(
         permission_mode="acceptEdits",
@@ -205,9 +361,9 @@ async def run_bridge(task_id: str, workdir: str, prompt: str):
             if isinstance(message, AssistantMessage):
                 for block in message.content:
                     if isinstance(block, TextBlock):
-                        append_log(_task_dir, block.text + "\n")
+                        append_log(block.text + "\n")
                     elif isinstance(block, ToolUseBlock):
-                        append_log(_task_dir, f"[Tool: {block.name}]\n")
+                        append_log(f"[Tool: {block.name}]\n")
 
             elif isinstance(message, ResultMessage):
                 result_data = {
@@ -236,9 +392,14 @@ async def run_bridge(task_id: str, workdir: str, prompt: str):
 
     except Exception as e:
         write_status(_task_dir, "error", f"{type(e).__name__}: {str(e)}")
-        append_log(_task_dir, f"\n[BRIDGE ERROR] {type(e).__name__}: {str(e)}\n")
+        append_log(f"\n[BRIDGE ERROR] {type(e).__name__}: {str(e)}\n")
         raise
 
+    finally:
+        if _answer_server is not None:
+            _answer_server.close()
+            socket_path.unlink(missing_ok=True)
+
 
 def main():
     parser = argparse.ArgumentParser(description="Claude Code Bridge")
@@ -259,6 +420,16 @@ def main():
 
 # Global reference to task directory for the can_use_tool callback
 _task_dir: Path = Path()
+# Unix socket server on _task_dir / "answer.sock", or None for file-based answers
+_answer_server: asyncio.Server | None = None
+# Future for the question currently waiting on answer.sock
+_pending_answer: asyncio.Future | None = None
+# inotify watcher on _task_dir, or None when polling
+_answer_watcher = None
+# fd for _task_dir / "output.log", opened in run_bridge
+_log_fd: int = -1
+# (status, detail) of the last status.json write
+_last_status_key: tuple[str, str] | None = None
 
 if __name__ == "__main__":
     main()
@@ -1,6 +1,7 @@
 #!/usr/bin/env bash
 # claude-bridge-answer.sh — Send an answer to a pending Claude Code question.
-# Writes answer.json atomically for the bridge to pick up.
+# Sends it over the task's answer.sock when present, otherwise writes
+# answer.json atomically (bridge running with CLAUDE_BRIDGE_IPC=file).
 
 set -euo pipefail
 
@@ -62,7 +63,36 @@ if [[ -f "$TASK_DIR/status.json" ]]; then
     fi
 fi
 
-# ── Write answer atomically ──────────────────────────────
+# ── Send answer over the bridge socket ───────────────────
+SOCKET_FILE="$TASK_DIR/answer.sock"
+
+if [[ -S "$SOCKET_FILE" ]]; then
+    if REPLY=$(python3 -c "
+import json, socket, sys
+from datetime import datetime
+data = {
+    'text': sys.argv[1],
+    'answered_at': datetime.now().isoformat(),
+}
+with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+    s.settimeout(10)
+    s.connect(sys.argv[2])
+    s.sendall(json.dumps(data).encode() + b'\\n')
+    print(s.makefile().readline().strip())
+" "$ANSWER" "$SOCKET_FILE" 2>/dev/null); then
+        if [[ "$REPLY" == "ok" ]]; then
+            echo "Answer sent to task '$TASK_ID'."
+            exit 0
+        fi
+        echo "Error: bridge rejected answer (${REPLY:-no reply})"
+        exit 1
+    fi
+    # A socket-mode bridge never reads answer.json, so don't fall back to it
+    echo "Error: could not deliver answer over $SOCKET_FILE (is the bridge still running?)"
+    exit 1
+fi
+
+# ── Write answer atomically (file-based IPC) ─────────────
 ANSWER_FILE="$TASK_DIR/answer.json"
 TMP_FILE="$TASK_DIR/answer.json.tmp"
 
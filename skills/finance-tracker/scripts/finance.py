@@ -5,15 +5,24 @@ Finance Tracker - Fetch comprehensive financial data for stocks, ETFs, and crypt
 
 import sys
 import json
+import importlib.util
+import math
 import subprocess
 from datetime import datetime, timedelta
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# One year of daily history, plus a week of slack so the 1-year lookup has a
+# trading day on or before it, covers every comparison we report.
+HISTORY_DAYS = 372
+
 def ensure_yfinance():
-    """Auto-install yfinance if not available."""
-    try:
-        import yfinance
-        return yfinance
-    except ImportError:
+    """Auto-install yfinance if not available, then import it."""
+    # find_spec checks for the package without importing pandas/numpy
+    if importlib.util.find_spec("yfinance") is None:
         print("Installing yfinance...", file=sys.stderr)
         try:
             # Try with --user flag first
@@ -21,32 +30,20 @@ def ensure_yfinance():
         except subprocess.CalledProcessError:
             # If that fails, try with --break-system-packages for externally-managed environments
             subprocess.check_call([sys.executable, "-m", "pip", "install", "-q", "--break-system-packages", "yfinance"])
-        import yfinance
-        return yfinance
+        importlib.invalidate_caches()
 
-def get_price_on_date(ticker, target_date):
-    """Get closing price for a specific date."""
-    try:
-        # Fetch data for a range around the target date
-        start = target_date - timedelta(days=7)
-        end = target_date + timedelta(days=1)
-        hist = ticker.history(start=start, end=end)
-
-        if hist.empty:
-            return None
-
-        # Find the closest date
-        closest_date = None
-        for date in hist.index:
-            if closest_date is None or abs((date.date() - target_date).days) < abs((closest_date.date() - target_date).days):
-                if date.date() <= target_date:
-                    closest_date = date
-
-        if closest_date is not None:
-            return float(hist.loc[closest_date]['Close'])
-    except Exception:
-        pass
-    return None
+    import yfinance
+    return yfinance
+
+def get_close_on_or_before(hist, target_date):
+    """Get closing price on the last trading day on or before a date."""
+    import pandas as pd
+
+    if hist.empty:
+        return None
+    target = pd.Timestamp(target_date).tz_localize(hist.index.tz)
+    close = hist['Close'].asof(target)
+    return None if pd.isna(close) else float(close)
 
 def calculate_change_pct(current, previous):
     """Calculate percentage change."""
@@ -54,61 +51,81 @@ def calculate_change_pct(current, previous):
         return None
     return ((current - previous) / previous) * 100
 
-def get_financial_data(symbol):
+def get_financial_data(symbol, yf):
     """Fetch and calculate all financial metrics."""
-    yf = ensure_yfinance()
-
     ticker = yf.Ticker(symbol)
+    today = datetime.now().date()
 
-    # Get current info
     try:
-        info = ticker.info
-        current_price = info.get('currentPrice') or info.get('regularMarketPrice')
+        hist = ticker.history(start=today - timedelta(days=HISTORY_DAYS))
+    except Exception as e:
+        return {"error": f"Failed to fetch historical data: {str(e)}"}
 
-        # If current price not in info, try latest from history
-        if current_price is None:
-            hist = ticker.history(period="5d")
-            if not hist.empty:
-                current_price = float(hist['Close'].iloc[-1])
+    return summarize_history(ticker, symbol, hist, today)
 
-        if current_price is None:
-            return {"error": f"Could not fetch current price for {symbol}"}
-
-        current_price = float(current_price)
+def get_financial_data_batch(symbols, yf):
+    """Fetch and calculate metrics for several symbols with one concurrent download."""
+    today = datetime.now().date()
 
+    try:
+        data = yf.download(
+            tickers=' '.join(symbols),
+            start=today - timedelta(days=HISTORY_DAYS),
+            group_by='ticker',
+            auto_adjust=True,
+            threads=True,
+            progress=False,
+        )
     except Exception as e:
-        return {"error": f"Failed to fetch data for {symbol}: {str(e)}"}
+        return [{"symbol": symbol, "error": f"Failed to fetch historical data: {str(e)}"} for symbol in symbols]
 
-    # Get historical data
-    try:
-        # Get last close (previous day)
-        hist_1d = ticker.history(period="5d")
-        if len(hist_1d) >= 2:
-            last_close = float(hist_1d['Close'].iloc[-2])
+    results = []
+    for symbol in symbols:
+        # download() aligns every ticker on one index, so drop the gaps
+        if symbol in data.columns.get_level_values(0):
+            hist = data[symbol].dropna(how='all')
         else:
-            last_close = current_price
+            hist = data.iloc[0:0]
+        results.append({"symbol": symbol, **summarize_history(yf.Ticker(symbol), symbol, hist, today)})
+    return results
 
-        # Get today's open
-        if len(hist_1d) >= 1:
-            todays_open = float(hist_1d['Open'].iloc[-1])
-        else:
-            todays_open = current_price
+def summarize_history(ticker, symbol, hist, today):
+    """Calculate all financial metrics from a symbol's daily history."""
+    # Skip rows without a close (yfinance emits NaN for halted/partial days)
+    if not hist.empty:
+        hist = hist[hist['Close'].notna()]
 
-        # Get last week's close (same day last week)
-        today = datetime.now().date()
-        last_week_date = today - timedelta(days=7)
-        last_week_close = get_price_on_date(ticker, last_week_date)
+    # Current price is the latest close; only ask .info if history is empty
+    try:
+        if not hist.empty:
+            current_price = float(hist['Close'].iloc[-1])
+        else:
+            info = ticker.info
+            current_price = info.get('currentPrice') or info.get('regularMarketPrice')
 
-        # Get 3-month history
-        three_months_ago = today - timedelta(days=90)
-        three_month_price = get_price_on_date(ticker, three_months_ago)
+        if current_price is None:
+            return {"error": f"Could not fetch current price for {symbol}"}
 
-        # Get 1-year history
-        one_year_ago = today - timedelta(days=365)
-        one_year_price = get_price_on_date(ticker, one_year_ago)
+        current_price = float(current_price)
 
     except Exception as e:
-        return {"error": f"Failed to fetch historical data: {str(e)}"}
+        return {"error": f"Failed to fetch data for {symbol}: {str(e)}"}
+
+    # Get last close (previous day)
+    if len(hist) >= 2:
+        last_close = float(hist['Close'].iloc[-2])
+    else:
+        last_close = current_price
+
+    # Get today's open
+    todays_open = float(hist['Open'].iloc[-1]) if len(hist) >= 1 else math.nan
+    if math.isnan(todays_open):
+        todays_open = current_price
+
+    # Same day last week, 3 months ago, 1 year ago
+    last_week_close = get_close_on_or_before(hist, today - timedelta(days=7))
+    three_month_price = get_close_on_or_before(hist, today - timedelta(days=90))
+    one_year_price = get_close_on_or_before(hist, today - timedelta(days=365))
 
     # Calculate changes
     change_vs_open_pct = calculate_change_pct(current_price, todays_open)
@@ -127,18 +144,40 @@ def get_financial_data(symbol):
         "one_year_change_pct": round(one_year_change_pct, 2) if one_year_change_pct else None,
     }
 
+def print_json(data):
+    """Print results as indented JSON, via orjson when installed."""
+    if orjson is not None:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY) + b"\n")
+        sys.stdout.buffer.flush()
+    else:
+        print(json.dumps(data, indent=2, ensure_ascii=False))
+
 def main():
     """Main entry point."""
-    if len(sys.argv) < 2:
-        print(json.dumps({"error": "Usage: finance.py SYMBOL"}))
+    # Accept "AAPL MSFT" as well as "AAPL,MSFT"
+    symbols = [s.strip().upper() for arg in sys.argv[1:] for s in arg.split(',') if s.strip()]
+    symbols = list(dict.fromkeys(symbols))
+
+    if not symbols:
+        print(json.dumps({"error": "Usage: finance.py SYMBOL [SYMBOL ...]"}))
         sys.exit(1)
 
-    symbol = sys.argv[1].upper()
+    # Only pay the yfinance/pandas import once we know there is work to do
+    yf = ensure_yfinance()
+
+    if len(symbols) == 1:
+        result = get_financial_data(symbols[0], yf)
+        print_json(result)
+
+        if "error" in result:
+            sys.exit(1)
+        return
 
-    result = get_financial_data(symbol)
-    print(json.dumps(result, indent=2))
+    results = get_financial_data_batch(symbols, yf)
+    print_json(results)
 
-    if "error" in result:
+    if any("error" in result for result in results):
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -5,6 +5,8 @@ Outputs JSON results to stdout, errors to stderr.
 """
 
 import argparse
+import functools
+import itertools
 import json
 import subprocess
 import sys
@@ -27,6 +29,17 @@ except ImportError:
         print("Please install manually: pip install duckduckgo-search", file=sys.stderr)
         sys.exit(2)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@functools.cache
+def get_ddgs():
+    """Return a shared DDGS client so repeated searches reuse its HTTP session."""
+    return DDGS(timeout=10)
+
 
 def parse_args():
     """Parse command-line arguments."""
@@ -79,21 +92,21 @@ def search_web(query, max_results=5, time_range=None, region="us-en"):
         List of result dictionaries
     """
     try:
-        ddgs = DDGS()
+        ddgs = get_ddgs()
 
         # Build search parameters
         search_params = {
             "keywords": query,
             "region": region,
-            "max_results": min(max_results, 10)  # Cap at 10
         }
 
         # Add time range if specified
         if time_range:
             search_params["timelimit"] = time_range
 
-        # Perform search
-        results = ddgs.text(**search_params)
+        # Perform search, capping at 10 here rather than via max_results,
+        # which some backends treat as a hint and over-fetch extra pages for
+        results = itertools.islice(ddgs.text(**search_params), min(max_results, 10))
 
         # Format results
         formatted_results = []
@@ -125,21 +138,20 @@ def search_news(query, max_results=5, time_range=None, region="us-en"):
         List of result dictionaries
     """
     try:
-        ddgs = DDGS()
+        ddgs = get_ddgs()
 
         # Build search parameters
         search_params = {
             "keywords": query,
             "region": region,
-            "max_results": min(max_results, 10)  # Cap at 10
         }
 
         # Add time range if specified
         if time_range:
             search_params["timelimit"] = time_range
 
-        # Perform news search
-        results = ddgs.news(**search_params)
+        # Perform news search (capped as in search_web)
+        results = itertools.islice(ddgs.news(**search_params), min(max_results, 10))
 
         # Format results
         formatted_results = []
@@ -157,6 +169,16 @@ def search_news(query, max_results=5, time_range=None, region="us-en"):
         return []
 
 
+def print_json(data):
+    """Print the search output as indented JSON, via orjson when installed."""
+    if orjson is not None:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2) + b"\n")
+        sys.stdout.buffer.flush()
+    else:
+        print(json.dumps(data, indent=2, ensure_ascii=False))
+
+
 def main():
     """Main entry point."""
     args = parse_args()
@@ -189,7 +211,7 @@ def main():
         "result_count": len(results)
     }
 
-    print(json.dumps(output, indent=2, ensure_ascii=False))
+    print_json(output)
 
     # Exit with appropriate code
     if not results:
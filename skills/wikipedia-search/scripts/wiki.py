@@ -5,9 +5,14 @@ Outputs JSON results to stdout, errors to stderr.
 """
 
 import argparse
+import functools
+import http.client
 import json
 import subprocess
 import sys
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 
 # Try to import wikipediaapi, auto-install if missing
 try:
@@ -27,6 +32,16 @@ except ImportError:
         print("Please install manually: pip install Wikipedia-API", file=sys.stderr)
         sys.exit(2)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+USER_AGENT = 'OpenClaw-WikipediaSearch/1.0'
+
+# TextExtracts' exsentences only accepts 1-10
+MAX_SUMMARY_SENTENCES = 10
+
 
 def parse_args():
     """Parse command-line arguments."""
@@ -49,7 +64,7 @@ def parse_args():
         "--sentences",
         type=int,
         default=5,
-        help="Number of sentences for summary mode (default: 5)"
+        help="Number of sentences for summary mode (default: 5, max: 10)"
     )
     parser.add_argument(
         "--lang",
@@ -61,6 +76,93 @@ def parse_args():
     return parser.parse_args()
 
 
+@functools.lru_cache(maxsize=4)
+def get_wiki(lang):
+    """Return a shared Wikipedia-API client (and its HTTP client) per language."""
+    return wikipediaapi.Wikipedia(
+        user_agent=USER_AGENT,
+        language=lang
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def get_connection(host):
+    """Return a keep-alive HTTPS connection to host, shared across API calls."""
+    return http.client.HTTPSConnection(host, timeout=10)
+
+
+def query_api(lang, params):
+    """
+    Call the MediaWiki API and return the decoded JSON response.
+
+    Args:
+        lang: Language code
+        params: Query parameters (format=json is added)
+
+    Returns:
+        Decoded JSON response
+    """
+    host = f"{lang}.wikipedia.org"
+    path = f"/w/api.php?{urllib.parse.urlencode({**params, 'format': 'json'})}"
+    headers = {'User-Agent': USER_AGENT}
+
+    # Behind a proxy, let urlopen apply the environment's proxy settings
+    if 'https' in urllib.request.getproxies() and not urllib.request.proxy_bypass(host):
+        data = urlopen_api(f"https://{host}{path}", headers)
+    else:
+        conn = get_connection(host)
+        try:
+            conn.request('GET', path, headers=headers)
+            response = conn.getresponse()
+        except ConnectionError:
+            # The server closed the idle connection; reconnect once
+            conn.close()
+            conn.request('GET', path, headers=headers)
+            response = conn.getresponse()
+        data = response.read()
+
+        if 300 <= response.status < 400:
+            # Let urlopen follow redirects (e.g. a renamed language domain)
+            data = urlopen_api(f"https://{host}{path}", headers)
+        elif response.status >= 400:
+            raise RuntimeError(f"MediaWiki API returned HTTP {response.status}")
+
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+def urlopen_api(url, headers):
+    """Fetch an API URL with urlopen (proxies and redirects handled) and return the body."""
+    request = urllib.request.Request(url, headers=headers)
+    with urllib.request.urlopen(request, timeout=10) as response:
+        return response.read()
+
+
+def query_page(lang, title, params):
+    """
+    Run an action=query request for a single page.
+
+    Args:
+        lang: Language code
+        title: Page title (redirects are followed)
+        params: Additional query parameters (prop, limits, ...)
+
+    Returns:
+        The page object from the response, or None if it does not exist
+    """
+    data = query_api(lang, {
+        'action': 'query',
+        'titles': title,
+        'redirects': 1,
+        **params,
+    })
+    pages = data.get('query', {}).get('pages', {})
+    page = next(iter(pages.values()), None)
+
+    if page is None or 'missing' in page or 'invalid' in page:
+        return None
+    return page
+
+
 def search_wikipedia(query, lang="en", limit=10):
     """
     Search for Wikipedia page titles matching the query.
@@ -74,29 +176,13 @@ def search_wikipedia(query, lang="en", limit=10):
         Dictionary with search results
     """
     try:
-        wiki = wikipediaapi.Wikipedia(
-            user_agent='OpenClaw-WikipediaSearch/1.0',
-            language=lang
-        )
-
-        # Wikipedia-API doesn't have a direct search method
-        # We'll try to get the page and use its links as suggestions
-        # For a proper search, we need to use the MediaWiki search API
-        import urllib.request
-        import urllib.parse
-
-        search_url = f"https://{lang}.wikipedia.org/w/api.php"
-        params = {
+        # Wikipedia-API doesn't have a direct search method, so use the
+        # MediaWiki OpenSearch API
+        data = query_api(lang, {
             'action': 'opensearch',
             'search': query,
             'limit': limit,
-            'format': 'json'
-        }
-
-        url = f"{search_url}?{urllib.parse.urlencode(params)}"
-
-        with urllib.request.urlopen(url) as response:
-            data = json.loads(response.read().decode())
+        })
 
         # OpenSearch returns: [query, [titles], [descriptions], [urls]]
         if len(data) >= 4:
@@ -150,14 +236,18 @@ def get_summary(title, lang="en", sentences=5):
         Dictionary with page summary
     """
     try:
-        wiki = wikipediaapi.Wikipedia(
-            user_agent='OpenClaw-WikipediaSearch/1.0',
-            language=lang
-        )
-
-        page = wiki.page(title)
-
-        if not page.exists():
+        # TextExtracts trims the intro to N sentences server-side, and the
+        # URL and categories come back in the same response.
+        page = query_page(lang, title, {
+            'prop': 'extracts|info|categories',
+            'exintro': 1,
+            'explaintext': 1,
+            'exsentences': max(1, min(sentences, MAX_SUMMARY_SENTENCES)),
+            'inprop': 'url',
+            'cllimit': 10,
+        })
+
+        if page is None:
             return {
                 "mode": "summary",
                 "title": title,
@@ -165,22 +255,13 @@ def get_summary(title, lang="en", sentences=5):
                 "error": "Page not found"
             }
 
-        # Get summary text
-        summary_text = page.summary[0:sentences * 200] if page.summary else ""
-
-        # Try to limit to requested number of sentences
-        if summary_text:
-            sentences_list = summary_text.replace('!', '.').replace('?', '.').split('.')
-            sentences_list = [s.strip() for s in sentences_list if s.strip()]
-            summary_text = '. '.join(sentences_list[:sentences]) + '.'
-
         return {
             "mode": "summary",
-            "title": page.title,
+            "title": page['title'],
             "exists": True,
-            "url": page.fullurl,
-            "summary": summary_text,
-            "categories": [cat for cat in page.categories.keys()][:10]  # Limit categories
+            "url": page.get('fullurl', ''),
+            "summary": page.get('extract', '').strip(),
+            "categories": [c['title'] for c in page.get('categories', [])]
         }
 
     except Exception as e:
@@ -205,14 +286,39 @@ def get_full_content(title, lang="en"):
         Dictionary with full page content
     """
     try:
-        wiki = wikipediaapi.Wikipedia(
-            user_agent='OpenClaw-WikipediaSearch/1.0',
-            language=lang
-        )
+        page = get_wiki(lang).page(title)
 
-        page = wiki.page(title)
+        # Get sections depth-first, in document order
+        def get_sections(section):
+            sections_data = []
+            stack = [(s, 0) for s in reversed(section.sections)]
+            while stack:
+                s, level = stack.pop()
+                sections_data.append({
+                    "title": s.title,
+                    "level": level,
+                    "text": s.text[:5000] if s.text else ""  # Limit section text
+                })
+                # Push subsections so the first one is visited next
+                stack.extend((child, level + 1) for child in reversed(s.sections))
+            return sections_data
 
-        if not page.exists():
+        def get_text():
+            return page.summary, get_sections(page)
+
+        # The extract (summary + sections, via Wikipedia-API) and the
+        # URL/categories/links query are independent, so run them side by side.
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            text_future = pool.submit(get_text)
+            meta = query_page(lang, title, {
+                'prop': 'info|categories|links',
+                'inprop': 'url',
+                'cllimit': 10,
+                'pllimit': 50,
+            })
+            summary, sections = text_future.result()
+
+        if meta is None:
             return {
                 "mode": "full",
                 "title": title,
@@ -220,29 +326,15 @@ def get_full_content(title, lang="en"):
                 "error": "Page not found"
             }
 
-        # Get sections recursively
-        def get_sections(section, level=0):
-            sections_data = []
-            for s in section.sections:
-                section_info = {
-                    "title": s.title,
-                    "level": level,
-                    "text": s.text[:5000] if s.text else ""  # Limit section text
-                }
-                sections_data.append(section_info)
-                # Recursively get subsections
-                sections_data.extend(get_sections(s, level + 1))
-            return sections_data
-
         return {
             "mode": "full",
-            "title": page.title,
+            "title": meta['title'],
             "exists": True,
-            "url": page.fullurl,
-            "summary": page.summary,
-            "sections": get_sections(page),
-            "categories": [cat for cat in page.categories.keys()][:10],
-            "links": list(page.links.keys())[:50]  # Limit to first 50 links
+            "url": meta.get('fullurl', ''),
+            "summary": summary,
+            "sections": sections,
+            "categories": [c['title'] for c in meta.get('categories', [])],
+            "links": [link['title'] for link in meta.get('links', [])]
         }
 
     except Exception as e:
@@ -255,6 +347,16 @@ def get_full_content(title, lang="en"):
         }
 
 
+def print_json(data):
+    """Print a mode result as indented JSON; orjson handles large full-mode text faster."""
+    if orjson is not None:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(data, option=orjson.OPT_INDENT_2) + b"\n")
+        sys.stdout.buffer.flush()
+    else:
+        print(json.dumps(data, indent=2, ensure_ascii=False))
+
+
 def main():
     """Main entry point."""
     args = parse_args()
@@ -276,7 +378,7 @@ def main():
         sys.exit(1)
 
     # Output JSON
-    print(json.dumps(result, indent=2, ensure_ascii=False))
+    print_json(result)
 
     # Exit with appropriate code
     if "error" in result: